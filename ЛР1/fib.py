@@ -1,5 +1,29 @@
+import array
+import threading
+from itertools import islice
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # numba не установлена - остаётся чистый Python
+    njit = None
+
+__all__ = [
+    "fib_gen",
+    "fib_gen_c",
+    "fib_gen_simplified",
+    "fibonacchi_gen",
+    "fibonacchi_korutina",
+    "fib",
+]
+
+_FIB_U64_MAX = 93  # F(93) - последнее число Фибоначчи, помещающееся в uint64
+
+
 class fib_gen:
     """Класс-итератор чисел Фибоначи (обычная версия)"""
+    __slots__ = ("a", "b")
+
     def __init__(self):
         self.a = 0
         self.b = 1
@@ -12,8 +36,7 @@ class fib_gen:
 
     def __next__(self):
         a = self.a
-        self.b += self.a
-        self.a = self.b - self.a
+        self.a, self.b = self.b, self.a + self.b
 
 
         # 0 1 1 2 3 5
@@ -28,22 +51,43 @@ class fib_gen:
         return a
 
 
+# fib_gen_c - итератор на машинных целых из fib_fast.pyx, если он собран.
+# Он отдаёт числа только до F(92), следующий next() бросает OverflowError.
+# Без сборки это обычный fib_gen, который не ограничен и не останавливается.
+try:
+    from fib_fast import FibGenC as fib_gen_c
+except ImportError:
+    fib_gen_c = fib_gen
+
+
 class fib_gen_simplified:
     """Класс для доступа к числам Фибоначчи по индексу"""
 
-    def __init__(self):
-        self.sequence = [0, 1]  # Начальные значения
+    # Экземпляры не хранят своих атрибутов - всё состояние общее, на уровне класса
+    __slots__ = ()
+
+    # Общая для всех экземпляров последовательность: уже посчитанные числа не пересчитываются.
+    # Пока значения помещаются в uint64 (до F(93)), храним их компактно в array
+    sequence = array.array("Q", (0, 1))  # Начальные значения
+    _lock = threading.Lock()
 
     def __getitem__(self, index):
         if index < 0:
             raise IndexError("Negative indices not supported")
 
-        # Генерируем последовательность до нужного индекса
-        while len(self.sequence) <= index:
-            next_val = self.sequence[-1] + self.sequence[-2]
-            self.sequence.append(next_val)
+        cls = type(self)
+        seq = cls.sequence
+        if len(seq) <= index:
+            # Генерируем последовательность до нужного индекса
+            with cls._lock:
+                seq = cls.sequence
+                if index > _FIB_U64_MAX and not isinstance(seq, list):
+                    # F(94) уже не влезает в uint64 - переходим на список длинных целых
+                    seq = cls.sequence = list(seq)
+                while len(seq) <= index:
+                    seq.append(seq[-1] + seq[-2])
 
-        return self.sequence[index]
+        return seq[index]
 
     def __iter__(self):
         # Для поддержки итерации - используем генератор
@@ -53,7 +97,7 @@ class fib_gen_simplified:
             i += 1
 
 def fibonacchi_gen():
-    """Генератор чисел Фибоначи"""
+    """Генератор чисел Фибоначи (для последовательного перебора; по индексу - fib())"""
     a = 0
     b = 1
 
@@ -63,14 +107,48 @@ def fibonacchi_gen():
         a = b
         b = res
 
+if njit is not None:
+    @njit(cache=True)
+    def _fib_u64(n):
+        """F(n) для n <= 93, скомпилированный numba цикл на uint64"""
+        a = np.uint64(0)
+        b = np.uint64(1)
+        for _ in range(n):
+            a, b = b, a + b
+        return a
+else:
+    # Без numba линейный цикл медленнее быстрого удвоения - fib() использует _fib_pair
+    _fib_u64 = None
+
+
+def _fib_pair(n):
+    """Пара (F(n), F(n+1)) методом быстрого удвоения за O(log n), без рекурсии"""
+    a, b = 0, 1
+    # Идём по битам n от старшего к младшему: удвоение индекса, а на единичном бите ещё +1
+    for bit in bin(n)[2:]:
+        c = a * ((b << 1) - a)  # F(2k) = F(k) * (2F(k+1) - F(k))
+        d = a * a + b * b       # F(2k+1) = F(k)^2 + F(k+1)^2
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+def fib(n):
+    """Число Фибоначчи F(n) по индексу (для произвольного доступа вместо fibonacchi_gen)"""
+    if n < 0:
+        raise ValueError("Negative indices not supported")
+    if _fib_u64 is not None and n <= _FIB_U64_MAX:
+        return int(_fib_u64(n))
+    # Дальше uint64 переполняется - считаем на длинных целых Python
+    return _fib_pair(n)[0]
+
 def fibonacchi_korutina():
-    """Сопрограмма (корутина) чисел Фибоначи"""
+    """Сопрограмма (корутина) чисел Фибоначи: принимает индексы через send().
+    Голый next() (то есть send(None)) завершает её с StopIteration"""
     index = yield
-    a = 0
-    b = 1
-    for _ in range(index):
-        a, b = b, a + b
-    yield a
+    while index is not None:
+        index = yield fib(index)
 
 
 
@@ -105,17 +183,21 @@ if __name__ == '__main__':
 
     print("\n\nЧисла фибоначи через генератор и сопрограмму:")
     print("\nГенератор:")
-    g = fibonacchi_gen()
-    for i in range(n):
-        print(next(g))
+    for value in islice(fibonacchi_gen(), n):
+        print(value)
 
     print("\nЧерез корутину:")
 
+    h = fibonacchi_korutina()
+    next(h)
     for i in range(n):
-        h = fibonacchi_korutina()
-        next(h)
         print(h.send(i))
 
+    print("\nПо индексу через fib():")
+    for i in range(n):
+        print(fib(i))
+    print(f"F(1000) = {fib(1000)}")
+
 
 
 
@@ -0,0 +1,39 @@
+# cython: language_level=3
+"""Cython-версия итератора чисел Фибоначи на машинных целых.
+
+Сборка: cythonize -i fib_fast.pyx
+"""
+
+from libc.limits cimport LLONG_MAX
+
+
+cdef class FibGenC:
+    """Класс-итератор чисел Фибоначи на long long (значения до F(92))"""
+    cdef long long a, b
+    cdef bint b_valid     # b ещё помещается в long long
+    cdef bint exhausted   # F(92) уже отдано, дальше только OverflowError
+
+    def __cinit__(self):
+        self.a = 0
+        self.b = 1
+        self.b_valid = True
+        self.exhausted = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.exhausted:
+            raise OverflowError("Fibonacci value does not fit in long long")
+        cdef long long r = self.a
+        if not self.b_valid:
+            # r - последнее представимое число, следующий вызов уже не вернёт значение
+            self.exhausted = True
+        elif self.b > LLONG_MAX - r:
+            # a + b переполнится, но b ещё можно отдать
+            self.a = self.b
+            self.b_valid = False
+        else:
+            self.a = self.b
+            self.b = r + self.b
+        return r
@@ -1,5 +1,11 @@
+import array
 import unittest
-from fib import fib_gen, fib_gen_simplified, fibonacchi_gen, fibonacchi_korutina
+from itertools import islice
+from fib import fib, fib_gen, fib_gen_c, fib_gen_simplified, fibonacchi_gen, fibonacchi_korutina
+
+
+# Эталонная последовательность собирается один раз при импорте модуля
+EXPECTED = (0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377)
 
 
 class TestFibonacciImplementations(unittest.TestCase):
@@ -7,7 +13,7 @@ class TestFibonacciImplementations(unittest.TestCase):
 
     def setUp(self):
         """Подготовка ожидаемой последовательности Фибоначчи."""
-        self.expected = [0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377]
+        self.expected = list(EXPECTED)
         self.test_length = len(self.expected)
 
     def test_fib_gen_class(self):
@@ -16,12 +22,41 @@ class TestFibonacciImplementations(unittest.TestCase):
         result = [next(fib_iter) for _ in range(self.test_length)]
         self.assertEqual(result, self.expected)
 
+    @unittest.skipUnless(fib_gen_c is not fib_gen, "fib_fast не собран")
+    def test_fib_gen_c_class(self):
+        """Тест Cython-итератора fib_gen_c."""
+        fib_iter = fib_gen_c()
+        result = [next(fib_iter) for _ in range(self.test_length)]
+        self.assertEqual(result, self.expected)
+
+    @unittest.skipUnless(fib_gen_c is not fib_gen, "fib_fast не собран")
+    def test_fib_gen_c_overflow(self):
+        """Тест: fib_gen_c отдаёт числа до F(92) включительно, затем OverflowError."""
+        fib_iter = fib_gen_c()
+        result = list(islice(fib_iter, 93))
+        self.assertEqual(result[91], fib(91))
+        self.assertEqual(result[92], fib(92))
+        with self.assertRaises(OverflowError):
+            next(fib_iter)
+
     def test_fib_gen_simplified_class(self):
         """Тест упрощённого класса fib_gen_simplified."""
+        # Последовательность общая для класса - начинаем с чистой и возвращаем прежнюю после теста
+        saved = fib_gen_simplified.sequence
+        fib_gen_simplified.sequence = array.array("Q", (0, 1))
+        self.addCleanup(setattr, fib_gen_simplified, "sequence", saved)
+
         fib_obj = fib_gen_simplified()
         result_indexed = [fib_obj[i] for i in range(self.test_length)]
         self.assertEqual(result_indexed, self.expected)
 
+        # После F(93) хранилище переходит с uint64 на длинные целые
+        self.assertEqual(fib_obj[93], fib(93))
+        self.assertIsInstance(fib_gen_simplified.sequence, array.array)
+        self.assertEqual(fib_obj[100], fib(100))
+        self.assertIsInstance(fib_gen_simplified.sequence, list)
+        self.assertEqual(fib_gen_simplified()[94], fib(94))
+
     def test_fibonacchi_gen_function(self):
         """Тест генераторной функции fibonacchi_gen."""
         fib_gen_func = fibonacchi_gen()
@@ -36,6 +71,30 @@ class TestFibonacciImplementations(unittest.TestCase):
             result = coro.send(i)
             self.assertEqual(result, self.expected[i])
 
+    def test_fibonacchi_korutina_reuse(self):
+        """Тест повторного использования одной сопрограммы для разных индексов."""
+        coro = fibonacchi_korutina()
+        next(coro)
+        result = [coro.send(i) for i in range(self.test_length)]
+        self.assertEqual(result, self.expected)
+
+        # next() вместо send() завершает сопрограмму, как и раньше
+        with self.assertRaises(StopIteration):
+            next(coro)
+
+    def test_fib_function(self):
+        """Тест функции произвольного доступа fib."""
+        result = [fib(i) for i in range(self.test_length)]
+        self.assertEqual(result, self.expected)
+
+        # Большие индексы считаются быстрым удвоением - сверяем с генератором
+        fib_gen_func = fibonacchi_gen()
+        sequence = [next(fib_gen_func) for _ in range(301)]
+        self.assertEqual(fib(300), sequence[300])
+
+        with self.assertRaises(ValueError):
+            fib(-1)
+
     def test_edge_cases(self):
         """Тест граничных случаев."""
         # Тест для индекса 0
@@ -67,14 +126,12 @@ class TestFibonacciImplementations(unittest.TestCase):
         n = 15
 
         # Создаём ОДИН экземпляр каждого типа
-        fib_iter = fib_gen()
-        result1 = [next(fib_iter) for _ in range(n)]
+        result1 = list(islice(fib_gen(), n))
 
         fib_simpl = fib_gen_simplified()
-        result2 = [fib_simpl[i] for i in range(n)]
+        result2 = list(map(fib_simpl.__getitem__, range(n)))
 
-        fib_gen_func = fibonacchi_gen()
-        result3 = [next(fib_gen_func) for _ in range(n)]
+        result3 = list(islice(fibonacchi_gen(), n))
 
         result4 = []
         for i in range(n):
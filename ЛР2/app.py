@@ -8,12 +8,54 @@ app.py
 import abc
 import csv
 import io
+import itertools
 import json
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
-import requests
 import yaml
 
+try:
+    import httpx
+except ImportError:  # без httpx используется requests
+    httpx = None
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML собран без LibYAML
+    from yaml import SafeDumper as _YamlDumper
+
+try:
+    import orjson
+except ImportError:  # без orjson используется стандартный json
+    orjson = None
+
+_WRITE_BUFFER_SIZE = 1 << 16
+_PREVIEW_KEYS = 10  # Сколько ключей показывает client_code
+
+
+def _make_client() -> Any:
+    """
+    Создаёт HTTP-клиент: httpx (по возможности с HTTP/2) или requests.Session.
+    Как и requests, httpx-клиент следует редиректам.
+    Таймаут передаётся в каждый get: у requests.Session нет общего таймаута.
+
+    Returns:
+        Any: Клиент с методом get(url, timeout=...).
+    """
+    if httpx is None:
+        import requests
+
+        return requests.Session()
+    try:
+        return httpx.Client(http2=True, follow_redirects=True)
+    except ImportError:  # для HTTP/2 нужен пакет h2
+        return httpx.Client(follow_redirects=True)
+
+
+# Общий клиент: повторные запросы переиспользуют TCP/TLS соединение (keep-alive)
+_CLIENT = _make_client()
 
 class CurrencyProvider(abc.ABC):
     """
@@ -21,6 +63,8 @@ class CurrencyProvider(abc.ABC):
     Определяет методы получения данных и сохранения в файл.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def get_data(self) -> Any:
         """
@@ -40,6 +84,11 @@ class CurrencyProvider(abc.ABC):
             filename (str): Имя файла для сохранения.
         """
 
+    def refresh(self) -> None:
+        """
+        Сбрасывает закешированные данные, следующий get_data загрузит их заново.
+        """
+
 
 
 class CBRProvider(CurrencyProvider):
@@ -47,11 +96,15 @@ class CBRProvider(CurrencyProvider):
     Конкретный компонент. Получает данные в формате JSON через API Центробанка.
     """
 
+    __slots__ = ("_data", "_lock")
+
     URL = "https://www.cbr-xml-daily.ru/daily_json.js"
 
     def __init__(self) -> None:
         """Инициализация провайдера."""
         self._data: Optional[Dict[str, Any]] = None
+        # Не даёт нескольким потокам одновременно загружать одни и те же данные
+        self._lock = threading.Lock()
 
     def get_data(self) -> dict[str, Any]:
         """
@@ -61,16 +114,25 @@ class CBRProvider(CurrencyProvider):
             Dict[str, Any]: Словарь с данными в формате JSON.
 
         Raises:
-            requests.RequestException: Если запрос к API не удался.
+            httpx.HTTPError | requests.RequestException: Если запрос к API не удался.
         """
         if self._data is None:
-            response = requests.get(self.URL, timeout=10)
-            response.raise_for_status()
-            self._data = response.json()
+            with self._lock:
+                if self._data is None:
+                    response = _CLIENT.get(self.URL, timeout=10)
+                    response.raise_for_status()
+                    if orjson is not None:
+                        self._data = orjson.loads(response.content)
+                    else:
+                        self._data = json.loads(response.content)
 
         assert self._data is not None
         return self._data
 
+    def refresh(self) -> None:
+        """Сбрасывает загруженные данные."""
+        self._data = None
+
     def save_to_file(self, filename: str) -> None:
         """
         Сохраняет данные в файл в формате JSON.
@@ -79,8 +141,14 @@ class CBRProvider(CurrencyProvider):
             filename (str): Путь к файлу (например, 'rates.json').
         """
         data = self.get_data()
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        if orjson is not None:
+            # orjson сразу отдаёт UTF-8 байты, отступ поддерживается только в 2 пробела
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            # json.dump пишет в файл мелкими кусками, крупный буфер сокращает число системных вызовов
+            with open(filename, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+                json.dump(data, f, ensure_ascii=False, indent=4)
 
 
 class CurrencyDecorator(CurrencyProvider):
@@ -88,6 +156,8 @@ class CurrencyDecorator(CurrencyProvider):
     Базовый класс декоратора. Хранит ссылку на объект CurrencyProvider.
     """
 
+    __slots__ = ("_provider", "_cached", "_source")
+
     _provider: CurrencyProvider
 
     def __init__(self, provider: CurrencyProvider) -> None:
@@ -98,6 +168,16 @@ class CurrencyDecorator(CurrencyProvider):
             provider (CurrencyProvider): Обертываемый объект.
         """
         self._provider = provider
+        # Кеш преобразованных данных и объект, из которого он получен:
+        # если обертываемый объект вернёт другие данные, кеш пересчитывается
+        self._cached: Optional[str] = None
+        self._source: Any = None
+
+    def refresh(self) -> None:
+        """Сбрасывает кеш декоратора и обертываемого объекта."""
+        self._cached = None
+        self._source = None
+        self._provider.refresh()
 
     def get_data(self) -> Any:
         """
@@ -123,6 +203,8 @@ class YamlDecorator(CurrencyDecorator):
     Конкретный декоратор. Преобразует данные в формат YAML.
     """
 
+    __slots__ = ()
+
     def get_data(self) -> str:
         """
         Получает данные от провайдера и конвертирует их в YAML строку.
@@ -131,7 +213,10 @@ class YamlDecorator(CurrencyDecorator):
             str: Данные в формате YAML.
         """
         raw_data = self._provider.get_data()
-        return yaml.dump(raw_data, allow_unicode=True, sort_keys=False)
+        if self._cached is None or raw_data is not self._source:
+            self._source = raw_data
+            self._cached = yaml.dump(raw_data, Dumper=_YamlDumper, allow_unicode=True, sort_keys=False)
+        return self._cached
 
     def save_to_file(self, filename: str) -> None:
         """
@@ -155,29 +240,38 @@ class CsvDecorator(CurrencyDecorator):
     Извлекает только основную информацию о валютах (CharCode, Name, Value).
     """
 
+    __slots__ = ()
+
+    FIELDNAMES = ("CharCode", "Name", "Value", "Nominal")
+
     @staticmethod
-    def _flatten_data(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _flatten_data(data: Dict[str, Any]) -> List[Tuple[Any, ...]]:
         """
-        Преобразует вложенную структуру JSON в плоский список для CSV.
+        Преобразует вложенную структуру JSON в плоский список строк для CSV.
 
         Args:
             data (Dict[str, Any]): Исходные данные JSON.
 
         Returns:
-            List[Dict[str, Any]]: Список словарей для строк CSV.
+            List[Tuple[Any, ...]]: Строки CSV в порядке полей FIELDNAMES.
         """
-        rows = []
         valutes = data.get("Valute", {})
-        for code, info in valutes.items():
-            rows.append(
-                {
-                    "CharCode": info.get("CharCode", code),
-                    "Name": info.get("Name", ""),
-                    "Value": info.get("Value", 0),
-                    "Nominal": info.get("Nominal", 1),
-                }
-            )
-        return rows
+        try:
+            # В ответе ЦБ все поля присутствуют - обходимся прямым доступом по ключу
+            return [
+                (info["CharCode"], info["Name"], info["Value"], info["Nominal"])
+                for info in valutes.values()
+            ]
+        except KeyError:
+            return [
+                (
+                    info.get("CharCode", code),
+                    info.get("Name", ""),
+                    info.get("Value", 0),
+                    info.get("Nominal", 1),
+                )
+                for code, info in valutes.items()
+            ]
 
     def get_data(self) -> str:
         """
@@ -187,16 +281,18 @@ class CsvDecorator(CurrencyDecorator):
             str: Данные в формате CSV.
         """
         raw_data = self._provider.get_data()
-        flat_data = self._flatten_data(raw_data)
+        if self._cached is None or raw_data is not self._source:
+            flat_data = self._flatten_data(raw_data)
 
-        output = io.StringIO()
-        if flat_data:
-            fieldnames = flat_data[0].keys()
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(flat_data)
+            output = io.StringIO()
+            if flat_data:
+                writer = csv.writer(output)
+                writer.writerow(self.FIELDNAMES)
+                writer.writerows(flat_data)
 
-        return output.getvalue()
+            self._source = raw_data
+            self._cached = output.getvalue()
+        return self._cached
 
     def save_to_file(self, filename: str) -> None:
         """
@@ -227,28 +323,43 @@ def client_code(provider: CurrencyProvider) -> None:
     if isinstance(data, str):
         print(f"Предпросмотр (100 символов): {data[:100]}...")
     elif isinstance(data, dict):
-        print(f"Ключи верхнего уровня: {list(data.keys())}")
+        preview = list(itertools.islice(data, _PREVIEW_KEYS))
+        print(f"Ключи верхнего уровня (первые {len(preview)}): {preview}")
     print("-" * 40)
 
 
 if __name__ == "__main__":
-    # 1. Базовый компонент (JSON)
+    # Один источник на все форматы: данные ЦБ загружаются единожды
     simple_provider = CBRProvider()
+
+    # 1. Базовый компонент (JSON)
     client_code(simple_provider)
-    simple_provider.save_to_file("rates.json")
-    print("Файл rates.json сохранен.\n")
 
     # 2. Декоратор YAML
-    yaml_provider = YamlDecorator(CBRProvider())
+    yaml_provider = YamlDecorator(simple_provider)
     client_code(yaml_provider)
-    yaml_provider.save_to_file("rates.yaml")
-    print("Файл rates.yaml сохранен.\n")
 
     # 3. Декоратор CSV
-    csv_provider = CsvDecorator(CBRProvider())
+    csv_provider = CsvDecorator(simple_provider)
     client_code(csv_provider)
-    csv_provider.save_to_file("rates.csv")
-    print("Файл rates.csv сохранен.\n")
+
+    # Сохранение в файлы - операции ввода-вывода, выполняем их параллельно
+    targets = [
+        (simple_provider, "rates.json"),
+        (yaml_provider, "rates.yaml"),
+        (csv_provider, "rates.csv"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        # Все три потока читают один CBRProvider; его get_data под блокировкой,
+        # так что данные загрузятся один раз, даже если их ещё нет в кеше
+        futures = [
+            (executor.submit(provider.save_to_file, filename), filename)
+            for provider, filename in targets
+        ]
+        for future, filename in futures:
+            future.result()
+            print(f"Файл {filename} сохранен.")
+    print()
 
     # 4. Цепочка декораторов (пример: можно получить JSON, но сохранить через CSV декоратор)
     # В данном контексте обычно декорируют источник, чтобы изменить формат вывода.
@@ -6,24 +6,28 @@ test_lab2.py
 Соблюдает принцип DAST (Tests).
 """
 
+import importlib.util
 import unittest
 from unittest.mock import MagicMock, patch
 import os
 import json
 import csv
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from app import CBRProvider, YamlDecorator, CsvDecorator
+import app
+from app import CBRProvider, YamlDecorator, CsvDecorator, _make_client
 
 
 class TestCBRProvider(unittest.TestCase):
     """Тесты для базового компонента (CBRProvider)."""
 
-    @patch("main.requests.get")
+    @patch("app._CLIENT.get")
     def test_get_data_returns_dict(self, mock_get):
         """Тест 1: Проверка, что get_data возвращает словарь."""
         # Arrange
         mock_response = MagicMock()
-        mock_response.json.return_value = {"Valute": {"USD": {"Value": 90.0}}}
+        mock_response.content = json.dumps({"Valute": {"USD": {"Value": 90.0}}}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
@@ -37,12 +41,12 @@ class TestCBRProvider(unittest.TestCase):
         self.assertIn("Valute", result)
         mock_get.assert_called_once()
 
-    @patch("main.requests.get")
+    @patch("app._CLIENT.get")
     def test_save_to_file_creates_json(self, mock_get):
         """Тест 2: Проверка сохранения файла в формате JSON."""
         # Arrange
         mock_response = MagicMock()
-        mock_response.json.return_value = {"test_key": "test_value"}
+        mock_response.content = json.dumps({"test_key": "test_value"}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
 
@@ -61,6 +65,57 @@ class TestCBRProvider(unittest.TestCase):
         # Cleanup
         os.remove(filename)
 
+    @patch("app._CLIENT.get")
+    def test_get_data_fetches_once_across_threads(self, mock_get):
+        """Тест 12: Параллельные вызовы get_data загружают данные один раз."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"Valute": {}}).encode()
+        mock_response.raise_for_status = MagicMock()
+
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            return mock_response
+
+        mock_get.side_effect = slow_get
+        provider = CBRProvider()
+
+        # Act
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(lambda _: provider.get_data(), range(3)))
+
+        # Assert
+        mock_get.assert_called_once()
+        self.assertTrue(all(result is results[0] for result in results))
+
+    @unittest.skipUnless(importlib.util.find_spec("requests"), "requests не установлен")
+    def test_get_data_with_requests_fallback(self):
+        """Тест 9: Без httpx данные загружаются через requests.Session."""
+        # Arrange
+        import requests
+
+        with patch("app.httpx", None):
+            client = _make_client()
+        self.assertIsInstance(client, requests.Session)
+
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"Valute": {}}).encode()
+        mock_response.raise_for_status = MagicMock()
+
+        # Act
+        with patch.object(client, "get", return_value=mock_response) as mock_get, \
+                patch("app._CLIENT", client):
+            result = CBRProvider().get_data()
+
+        # Assert
+        self.assertEqual(result, {"Valute": {}})
+        mock_get.assert_called_once_with(CBRProvider.URL, timeout=10)
+
+    @unittest.skipUnless(app.httpx is not None, "httpx не установлен")
+    def test_httpx_client_follows_redirects(self):
+        """Тест 10: httpx-клиент, как и requests, следует редиректам."""
+        self.assertTrue(_make_client().follow_redirects)
+
 
 class TestYamlDecorator(unittest.TestCase):
     """Тесты для декоратора YAML."""
@@ -159,6 +214,78 @@ class TestCsvDecorator(unittest.TestCase):
         rows = list(reader)
         self.assertEqual(rows[0]["CharCode"], "RUB")
 
+    def test_get_data_is_cached_until_refresh(self):
+        """Тест 7: Повторный get_data не пересчитывает CSV, пока не вызван refresh."""
+        # Arrange
+        mock_provider = MagicMock()
+        mock_provider.get_data.return_value = {
+            "Valute": {
+                "USD": {"CharCode": "USD", "Name": "Доллар", "Value": 90.0, "Nominal": 1}
+            }
+        }
+
+        decorator = CsvDecorator(mock_provider)
+
+        # Act
+        first = decorator.get_data()
+        second = decorator.get_data()
+
+        # Assert
+        self.assertIs(first, second)
+
+        # Act
+        decorator.refresh()
+        third = decorator.get_data()
+
+        # Assert
+        mock_provider.refresh.assert_called_once()
+        self.assertIsNot(third, first)
+        self.assertEqual(third, first)
+
+    def test_get_data_fills_missing_fields(self):
+        """Тест 8: Отсутствующие поля валюты заменяются значениями по умолчанию."""
+        # Arrange
+        mock_provider = MagicMock()
+        mock_provider.get_data.return_value = {
+            "Valute": {
+                "USD": {"CharCode": "USD", "Name": "Доллар", "Value": 90.0, "Nominal": 1},
+                "XYZ": {"Value": 5.0}
+            }
+        }
+
+        decorator = CsvDecorator(mock_provider)
+
+        # Act
+        result = decorator.get_data()
+
+        # Assert
+        self.assertIn("USD,Доллар,90.0,1", result)
+        self.assertIn("XYZ,,5.0,1", result)
+
+    def test_get_data_follows_new_provider_data(self):
+        """Тест 11: Новые данные провайдера пересчитывают CSV без refresh декоратора."""
+        # Arrange
+        provider = CBRProvider()
+        provider._data = {
+            "Valute": {
+                "USD": {"CharCode": "USD", "Name": "Доллар", "Value": 90.0, "Nominal": 1}
+            }
+        }
+        decorator = CsvDecorator(provider)
+        self.assertIn("USD,Доллар,90.0,1", decorator.get_data())
+
+        # Act
+        provider._data = {
+            "Valute": {
+                "EUR": {"CharCode": "EUR", "Name": "Евро", "Value": 98.0, "Nominal": 1}
+            }
+        }
+        result = decorator.get_data()
+
+        # Assert
+        self.assertIn("EUR,Евро,98.0,1", result)
+        self.assertNotIn("USD", result)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file